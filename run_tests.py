@@ -3,6 +3,7 @@
 Pytest-based test runner for PDF Cracker.
 """
 
+import argparse
 import sys
 import subprocess
 from pathlib import Path
@@ -15,14 +16,19 @@ def run_pytest_command(args):
         result = subprocess.run(cmd, cwd=Path(__file__).parent)
         return result.returncode == 0
     except FileNotFoundError:
-        print("❌ pytest not found. Install with: pip install pytest pytest-cov")
+        print("❌ pytest not found. Install with: pip install pytest pytest-cov pytest-xdist")
         return False
 
 
+def worker_count(value):
+    """Validate a pytest-xdist worker count: 'auto' or a positive integer."""
+    if value == 'auto' or (value.isdigit() and int(value) > 0):
+        return value
+    raise argparse.ArgumentTypeError(f"expected 'auto' or a positive integer, got '{value}'")
+
+
 def main():
     """Main test runner."""
-    import argparse
-    
     parser = argparse.ArgumentParser(description='Run PDF Cracker tests with pytest')
     parser.add_argument(
         'test',
@@ -54,6 +60,12 @@ def main():
         action='store_true',
         help='Include tests requiring external dependencies'
     )
+    parser.add_argument(
+        '--parallel', '-n',
+        type=worker_count,
+        metavar='WORKERS',
+        help="Run tests in parallel with pytest-xdist ('auto' for one worker per core)"
+    )
     parser.add_argument(
         '--verbose', '-v',
         action='store_true',
@@ -75,6 +87,9 @@ def main():
     if args.coverage:
         pytest_args.extend(['--cov=src', '--cov-report=term-missing', '--cov-report=html'])
     
+    if args.parallel:
+        pytest_args.extend(['-n', args.parallel])
+    
     # Test selection by markers
     markers = []
     if not args.slow:
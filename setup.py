@@ -57,6 +57,7 @@ setup(
         "dev": [
             "pytest>=7.0.0",
             "pytest-cov>=4.0.0",
+            "pytest-xdist>=3.0.0",
             "black>=22.0.0",
             "flake8>=4.0.0",
         ],
@@ -1,10 +1,31 @@
 #!/usr/bin/env python3
 
 import subprocess
-import os
+from functools import lru_cache
 from pathlib import Path
 from typing import Union, Optional, Callable
 
+from .tool_locator import cache_found, find_executable
+
+
+# Buffer size for wordlist output files (default open() buffering is ~8 KiB)
+_WRITE_BUFFER_SIZE = 1 << 20
+
+# Numbers formatted and written per chunk by the Python fallback
+_NUMBERS_PER_CHUNK = 100000
+
+
+@lru_cache(maxsize=None)
+def _low_digit_lines(width: int) -> tuple:
+    """Every zero-padded number of the given width, newline-terminated."""
+    return tuple(b"%0*d\n" % (width, i) for i in range(10 ** width))
+
+
+@cache_found
+def _locate_crunch() -> Optional[str]:
+    """Locate the crunch executable and remember it once found."""
+    return find_executable('crunch', ['/usr/bin/crunch', '/opt/homebrew/bin/crunch'])
+
 
 class CrunchWrapper:
     """Simple wrapper for Crunch wordlist generator - focuses on number ranges and character combinations."""
@@ -15,13 +36,7 @@ class CrunchWrapper:
     
     def _find_crunch(self) -> Optional[str]:
         """Find Crunch executable."""
-        crunch_paths = ['crunch', '/usr/bin/crunch', '/opt/homebrew/bin/crunch']
-        
-        for path in crunch_paths:
-            if os.path.exists(path) or subprocess.run(['which', path], capture_output=True).returncode == 0:
-                return path
-        
-        return None
+        return _locate_crunch()
     
     def generate_number_range(
         self,
@@ -100,13 +115,40 @@ class CrunchWrapper:
             
             total_numbers = max_number - min_number + 1
             
-            with open(output_path, 'w') as f:
-                for i, number in enumerate(range(min_number, max_number + 1)):
-                    f.write(f"{number:0{digits}d}\n")
+            # Numbers are split into a high prefix and the last (up to) four digits;
+            # each run sharing a prefix is the prefix joined over the low-digit table.
+            # The split only holds for non-negative numbers with at least one digit,
+            # anything else is formatted number by number.
+            split_digits = min_number >= 0 and digits >= 1
+            low_digits = min(max(digits, 1), 4)
+            high_digits = digits - low_digits
+            step = 10 ** low_digits
+            low_lines = _low_digit_lines(low_digits)
+            
+            with open(output_path, 'wb', buffering=_WRITE_BUFFER_SIZE) as f:
+                for chunk_start in range(min_number, max_number + 1, _NUMBERS_PER_CHUNK):
+                    if progress_callback:
+                        generated = chunk_start - min_number
+                        progress = (generated / total_numbers) * 100
+                        progress_callback(progress, f"Generated {generated:,} numbers")
+                    
+                    chunk_end = min(chunk_start + _NUMBERS_PER_CHUNK, max_number + 1)
+                    if not split_digits:
+                        f.write(b"".join(
+                            b"%0*d\n" % (digits, number) for number in range(chunk_start, chunk_end)
+                        ))
+                        continue
                     
-                    if progress_callback and i % 100000 == 0:
-                        progress = (i / total_numbers) * 100
-                        progress_callback(progress, f"Generated {i:,} numbers")
+                    number = chunk_start
+                    while number < chunk_end:
+                        high, low = divmod(number, step)
+                        stop = min(chunk_end - high * step, step)
+                        if high_digits:
+                            prefix = b"%0*d" % (high_digits, high)
+                        else:
+                            prefix = b"%d" % high if high else b""
+                        f.write(prefix + prefix.join(low_lines[low:stop]))
+                        number += stop - low
             
             if progress_callback:
                 progress_callback(100, f"Python number generation complete - {total_numbers:,} numbers")
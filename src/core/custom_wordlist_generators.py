@@ -4,9 +4,112 @@ Custom wordlist generators for specialized password patterns.
 Handles date-based passwords, Buddhist calendar dates, and other patterns.
 """
 
-from typing import Optional, Callable, Union
+from contextlib import ExitStack
+from functools import lru_cache
+from typing import Optional, Callable, Union, BinaryIO
 from pathlib import Path
-from datetime import datetime, timedelta
+
+
+# Zero-padded day, month and two-digit year fields, indexed by value
+_DD = tuple(b"%02d" % i for i in range(32))
+_MM = tuple(b"%02d" % i for i in range(13))
+_YY = tuple(b"%02d" % i for i in range(100))
+
+# Days per month, indexed by [is_leap][month - 1]
+_DAYS_IN_MONTH = (
+    (31, 28, 31, 30, 31, 30, 31, 31, 30, 31, 30, 31),
+    (31, 29, 31, 30, 31, 30, 31, 31, 30, 31, 30, 31),
+)
+
+# (day, month) for every day of a common or leap year in calendar order,
+# indexed by [is_leap]; every year of the same kind shares its sequence
+_YEAR_DAYS = tuple(
+    tuple(
+        (day, month)
+        for month in range(1, 13)
+        for day in range(1, days_in_month[month - 1] + 1)
+    )
+    for days_in_month in _DAYS_IN_MONTH
+)
+
+# Field layout (value, width) of each supported date format
+_DATE_FORMATS = {
+    "DDMMYYYY": (("d", 2), ("m", 2), ("y", 4)),
+    "DDMMYY": (("d", 2), ("m", 2), ("y", 2)),
+    "YYYYMMDD": (("y", 4), ("m", 2), ("d", 2)),
+}
+
+# Width of the year field in each date format
+_YEAR_WIDTH = {fmt: dict(layout)["y"] for fmt, layout in _DATE_FORMATS.items()}
+
+# Year blocks are only a few KiB, so they're batched into writes of about this size
+_WRITE_BATCH_SIZE = 1 << 20
+
+
+def _is_leap_year(year: int) -> bool:
+    """Check whether a Gregorian year is a leap year."""
+    # Divisible by 4, and either not by 100 (i.e. not by 25) or also by 400 (i.e. by 16)
+    return not (year & 3) and (year % 25 != 0 or not (year & 15))
+
+
+def _leap_years_through(year: int) -> int:
+    """Count Gregorian leap years from year 1 up to and including ``year``."""
+    return year // 4 - year // 100 + year // 400
+
+
+@lru_cache(maxsize=None)
+def _year_pieces(date_format: str, leap: bool) -> tuple:
+    """
+    Static parts of a year block in one date format.
+    
+    Only the year field changes between years, so a block is these pieces
+    joined with the year field: each piece holds the newline and day/month
+    fields that sit between two consecutive year fields.
+    """
+    layout = _DATE_FORMATS[date_format]
+    year_index = [value for value, _ in layout].index("y")
+    
+    pieces = []
+    tail = b""
+    for day, month in _YEAR_DAYS[leap]:
+        fields = {"d": _DD[day], "m": _MM[month]}
+        before = b"".join(fields[value] for value, _ in layout[:year_index])
+        after = b"".join(fields[value] for value, _ in layout[year_index + 1:])
+        pieces.append(tail + before)
+        tail = after + b"\n"
+    pieces.append(tail)
+    
+    return tuple(pieces)
+
+
+def _open_output(stack: ExitStack, output: Union[str, Path, BinaryIO]) -> BinaryIO:
+    """Open an output path on the stack, or pass an already-open binary stream through."""
+    if hasattr(output, 'write'):
+        return output
+    return stack.enter_context(open(output, 'wb', buffering=_WRITE_BATCH_SIZE))
+
+
+@lru_cache(maxsize=1024)
+def _year_block(calendar_year: int, output_year: int, date_format: str) -> bytes:
+    """
+    Build every record for one calendar year.
+    
+    Blocks are cached, so Gregorian and Buddhist runs over the same years
+    only format each year once per process.
+    
+    Args:
+        calendar_year: Gregorian year whose days are walked
+        output_year: Year written into each record
+        date_format: Supported date format
+        
+    Returns:
+        Newline-terminated records for the whole year
+    """
+    if _YEAR_WIDTH[date_format] == 2:
+        year_field = _YY[output_year % 100]
+    else:
+        year_field = b"%04d" % output_year
+    return year_field.join(_year_pieces(date_format, _is_leap_year(calendar_year)))
 
 
 class DateWordlistGenerator:
@@ -14,7 +117,7 @@ class DateWordlistGenerator:
     
     def generate_date_wordlist(
         self,
-        output_path: Union[str, Path],
+        output_path: Union[str, Path, BinaryIO],
         start_year: int,
         end_year: int,
         date_format: str = "DDMMYYYY",
@@ -24,7 +127,7 @@ class DateWordlistGenerator:
         Generate date-based wordlist.
         
         Args:
-            output_path: Output file path
+            output_path: Output file path or writable binary stream
             start_year: Starting year
             end_year: Ending year (inclusive)
             date_format: Date format (DDMMYYYY, DDMMYY, YYYYMMDD)
@@ -33,50 +136,11 @@ class DateWordlistGenerator:
         Returns:
             True if successful, False otherwise
         """
-        try:
-            if progress_callback:
-                progress_callback(0, f"Generating dates {start_year}-{end_year}")
-            
-            total_years = end_year - start_year + 1
-            passwords_written = 0
-            
-            with open(output_path, 'w') as f:
-                for year_offset, year in enumerate(range(start_year, end_year + 1)):
-                    # Generate all valid dates for this year
-                    current_date = datetime(year, 1, 1)
-                    end_date = datetime(year, 12, 31)
-                    
-                    while current_date <= end_date:
-                        if date_format == "DDMMYYYY":
-                            password = f"{current_date.day:02d}{current_date.month:02d}{current_date.year:04d}"
-                        elif date_format == "DDMMYY":
-                            password = f"{current_date.day:02d}{current_date.month:02d}{current_date.year % 100:02d}"
-                        elif date_format == "YYYYMMDD":
-                            password = f"{current_date.year:04d}{current_date.month:02d}{current_date.day:02d}"
-                        else:
-                            return False
-                        
-                        f.write(password + '\n')
-                        passwords_written += 1
-                        current_date += timedelta(days=1)
-                    
-                    if progress_callback:
-                        progress = ((year_offset + 1) / total_years) * 100
-                        progress_callback(progress, f"Generated year {year}")
-            
-            if progress_callback:
-                progress_callback(100, f"Date generation complete - {passwords_written:,} passwords")
-            
-            return True
-            
-        except Exception as e:
-            if progress_callback:
-                progress_callback(0, f"Error: {str(e)}")
-            return False
+        return self.generate_both(output_path, None, start_year, end_year, date_format, progress_callback)
 
     def generate_buddhist_dates(
         self,
-        output_path: Union[str, Path],
+        output_path: Union[str, Path, BinaryIO],
         start_year: int,
         end_year: int,
         date_format: str = "DDMMYYYY",
@@ -86,7 +150,7 @@ class DateWordlistGenerator:
         Generate Buddhist calendar dates (Gregorian + 543 years).
         
         Args:
-            output_path: Output file path
+            output_path: Output file path or writable binary stream
             start_year: Starting Gregorian year
             end_year: Ending Gregorian year (inclusive)
             date_format: Date format
@@ -95,45 +159,105 @@ class DateWordlistGenerator:
         Returns:
             True if successful, False otherwise
         """
-        # Convert to Buddhist years (+543)
-        buddhist_start = start_year + 543
-        buddhist_end = end_year + 543
+        return self.generate_both(None, output_path, start_year, end_year, date_format, progress_callback)
+    
+    def generate_both(
+        self,
+        gregorian_path: Optional[Union[str, Path, BinaryIO]],
+        buddhist_path: Optional[Union[str, Path, BinaryIO]],
+        start_year: int,
+        end_year: int,
+        date_format: str = "DDMMYYYY",
+        progress_callback: Optional[Callable[[float, str], None]] = None
+    ) -> bool:
+        """
+        Generate Gregorian and Buddhist date wordlists in a single pass over the years.
         
-        if progress_callback:
-            progress_callback(0, f"Generating Buddhist dates {buddhist_start}-{buddhist_end}")
+        Args:
+            gregorian_path: Gregorian output file path or binary stream (None to skip)
+            buddhist_path: Buddhist output file path or binary stream (None to skip)
+            start_year: Starting Gregorian year
+            end_year: Ending Gregorian year (inclusive)
+            date_format: Date format (DDMMYYYY, DDMMYY, YYYYMMDD)
+            progress_callback: Optional progress callback
+            
+        Returns:
+            True if successful, False otherwise
+        """
+        if buddhist_path is None:
+            title = f"dates {start_year}-{end_year}"
+            complete = "Date generation complete"
+        elif gregorian_path is None:
+            title = f"Buddhist dates {start_year + 543}-{end_year + 543}"
+            complete = "Buddhist date generation complete"
+        else:
+            title = f"Gregorian and Buddhist dates {start_year}-{end_year}"
+            complete = "Date generation complete"
         
         try:
+            if progress_callback:
+                progress_callback(0, f"Generating {title}")
+            
+            if date_format not in _DATE_FORMATS:
+                return False
+            
             total_years = end_year - start_year + 1
             passwords_written = 0
+            last_percent = 0
             
-            with open(output_path, 'w') as f:
-                for year_offset, gregorian_year in enumerate(range(start_year, end_year + 1)):
-                    buddhist_year = gregorian_year + 543
+            # Year blocks are pre-encoded, so they're joined into ~1 MiB batches; the
+            # buffered writer passes batches that size straight through, retries short
+            # writes and raises on a full disk.
+            # Streams passed in by the caller are written to but not closed.
+            with ExitStack() as stack:
+                gregorian_file = buddhist_file = None
+                if gregorian_path is not None:
+                    gregorian_file = _open_output(stack, gregorian_path)
+                if buddhist_path is not None:
+                    buddhist_file = _open_output(stack, buddhist_path)
+                
+                gregorian_batch = []
+                buddhist_batch = []
+                batch_size = 0
+                
+                for year_offset, year in enumerate(range(start_year, end_year + 1)):
+                    buddhist_year = year + 543
+                    days = self._days_in_year(year)
                     
-                    # Generate all valid dates for this year
-                    current_date = datetime(gregorian_year, 1, 1)
-                    end_date = datetime(gregorian_year, 12, 31)
+                    if gregorian_file is not None:
+                        block = _year_block(year, year, date_format)
+                        gregorian_batch.append(block)
+                        batch_size += len(block)
+                        passwords_written += days
+                    if buddhist_file is not None:
+                        block = _year_block(year, buddhist_year, date_format)
+                        buddhist_batch.append(block)
+                        batch_size += len(block)
+                        passwords_written += days
                     
-                    while current_date <= end_date:
-                        if date_format == "DDMMYYYY":
-                            password = f"{current_date.day:02d}{current_date.month:02d}{buddhist_year:04d}"
-                        elif date_format == "DDMMYY":
-                            password = f"{current_date.day:02d}{current_date.month:02d}{buddhist_year % 100:02d}"
-                        elif date_format == "YYYYMMDD":
-                            password = f"{buddhist_year:04d}{current_date.month:02d}{current_date.day:02d}"
-                        else:
-                            return False
-                        
-                        f.write(password + '\n')
-                        passwords_written += 1
-                        current_date += timedelta(days=1)
+                    if batch_size >= _WRITE_BATCH_SIZE or year == end_year:
+                        if gregorian_file is not None:
+                            gregorian_file.write(b"".join(gregorian_batch))
+                            gregorian_batch.clear()
+                        if buddhist_file is not None:
+                            buddhist_file.write(b"".join(buddhist_batch))
+                            buddhist_batch.clear()
+                        batch_size = 0
                     
                     if progress_callback:
                         progress = ((year_offset + 1) / total_years) * 100
-                        progress_callback(progress, f"Generated Buddhist year {buddhist_year}")
+                        if int(progress) != last_percent:
+                            last_percent = int(progress)
+                            if buddhist_file is None:
+                                message = f"Generated year {year}"
+                            elif gregorian_file is None:
+                                message = f"Generated Buddhist year {buddhist_year}"
+                            else:
+                                message = f"Generated year {year} (Buddhist {buddhist_year})"
+                            progress_callback(progress, message)
             
             if progress_callback:
-                progress_callback(100, f"Buddhist date generation complete - {passwords_written:,} passwords")
+                progress_callback(100, f"{complete} - {passwords_written:,} passwords")
             
             return True
             
@@ -141,6 +265,11 @@ class DateWordlistGenerator:
             if progress_callback:
                 progress_callback(0, f"Error: {str(e)}")
             return False
+    
+    @staticmethod
+    def _days_in_year(year: int) -> int:
+        """Number of days in a Gregorian year."""
+        return 365 + _is_leap_year(year)
 
 
 class CustomWordlistGenerator:
@@ -157,12 +286,14 @@ class CustomWordlistGenerator:
         """Generate Buddhist calendar dates."""
         return self.date_generator.generate_buddhist_dates(*args, **kwargs)
     
+    def generate_both(self, *args, **kwargs):
+        """Generate Gregorian and Buddhist calendar dates in one pass."""
+        return self.date_generator.generate_both(*args, **kwargs)
+    
     def calculate_date_count(self, start_year: int, end_year: int) -> int:
         """Calculate number of valid dates in range."""
-        total_days = 0
-        for year in range(start_year, end_year + 1):
-            if (year % 4 == 0 and year % 100 != 0) or (year % 400 == 0):
-                total_days += 366  # Leap year
-            else:
-                total_days += 365
-        return total_days
\ No newline at end of file
+        if end_year < start_year:
+            return 0
+        
+        leap_years = _leap_years_through(end_year) - _leap_years_through(start_year - 1)
+        return (end_year - start_year + 1) * 365 + leap_years
@@ -5,11 +5,28 @@ import os
 import tempfile
 import time
 import threading
+import weakref
 from pathlib import Path
 from typing import Optional, Union, Callable
 from dataclasses import dataclass
 
 from .pdf_processor import PDFProcessor
+from .tool_locator import cache_found, find_executable
+
+
+@cache_found
+def _locate_john() -> Optional[str]:
+    """Locate the John the Ripper executable and remember it once found."""
+    return find_executable('john', ['/usr/bin/john', '/opt/homebrew/bin/john'])
+
+
+def _remove_hash_files(hash_files: dict) -> None:
+    """Delete the temporary hash files tracked by a PDFCracker."""
+    for _, hash_file_path in hash_files.values():
+        if os.path.exists(hash_file_path):
+            os.unlink(hash_file_path)
+    
+    hash_files.clear()
 
 
 @dataclass
@@ -32,13 +49,10 @@ class JohnWrapper:
     
     def _find_john(self) -> str:
         """Find John the Ripper executable."""
-        john_paths = ['john', '/usr/bin/john', '/opt/homebrew/bin/john']
-        
-        for path in john_paths:
-            if os.path.exists(path) or subprocess.run(['which', path], capture_output=True).returncode == 0:
-                return path
-        
-        raise FileNotFoundError("John the Ripper not found. Please install john.")
+        john_path = _locate_john()
+        if john_path is None:
+            raise FileNotFoundError("John the Ripper not found. Please install john.")
+        return john_path
     
     def crack_hash(
         self,
@@ -149,14 +163,24 @@ class JohnWrapper:
         """Extract cracked password from John's output."""
         try:
             cmd = [self.john_path, '--show', str(hash_file_path)]
-            result = subprocess.run(cmd, capture_output=True, text=True)
-            
-            output = result.stdout.strip()
-            if output and ':' in output:
-                first_line = output.split('\n')[0]
-                if ':' in first_line:
-                    password = first_line.split(':', 1)[1]
-                    return password
+            with subprocess.Popen(
+                cmd,
+                stdout=subprocess.PIPE,
+                stderr=subprocess.DEVNULL,
+                text=True
+            ) as process:
+                try:
+                    # Only the first line can hold the cracked "file:password" entry
+                    for line in process.stdout:
+                        first_line = line.rstrip('\r\n')
+                        if not first_line.strip():
+                            continue
+                        if ':' in first_line:
+                            return first_line.split(':', 1)[1]
+                        return None
+                finally:
+                    if process.poll() is None:
+                        process.terminate()
             
             return None
             
@@ -180,6 +204,11 @@ class PDFCracker:
     def __init__(self):
         self.john = JohnWrapper()
         self.pdf_processor = PDFProcessor()
+        self._hash_files = {}
+        self._hash_cache = {}
+        
+        # Remove hash files even if the caller never uses cleanup() or a with block
+        weakref.finalize(self, _remove_hash_files, self._hash_files)
     
     def crack_pdf(
         self,
@@ -203,36 +232,85 @@ class PDFCracker:
         if not pdf_path.exists():
             return CrackResult(success=False, error=f"PDF file not found: {pdf_path}")
         
-        # Check if PDF is password protected
-        if not self.pdf_processor.is_pdf_protected(pdf_path):
-            return CrackResult(
-                success=True, 
-                password=None, 
-                error="PDF is not password protected", 
-                time_taken=0.0, 
-                attempts=0
-            )
-        
-        # Extract hash from PDF
         try:
-            with tempfile.NamedTemporaryFile(mode='w', suffix='.hash', delete=False) as hash_file:
-                hash_output = self.pdf_processor.extract_hash(pdf_path)
-                hash_file.write(hash_output)
-                hash_file_path = hash_file.name
+            # One pdf2john run both checks protection and gives the hash to crack
+            hash_output = self._protected_hash(pdf_path)
+            if hash_output is None:
+                return CrackResult(
+                    success=True, 
+                    password=None, 
+                    error="PDF is not password protected", 
+                    time_taken=0.0, 
+                    attempts=0
+                )
             
-            try:
-                return self.john.crack_hash(hash_file_path, wordlist_path, progress_callback)
-            finally:
-                if os.path.exists(hash_file_path):
-                    os.unlink(hash_file_path)
+            # Write the hash file once per PDF, reused across wordlists
+            hash_file_path = self._get_hash_file(pdf_path, hash_output)
+            return self.john.crack_hash(hash_file_path, wordlist_path, progress_callback)
                     
         except Exception as e:
             return CrackResult(success=False, error=str(e))
     
+    def _protection_key(self, pdf_path: Union[str, Path]) -> Optional[tuple]:
+        """Cache key for a PDF's hash (None if the file can't be stat'ed)."""
+        try:
+            return (str(pdf_path), os.stat(pdf_path).st_mtime_ns)
+        except OSError:
+            return None
+    
+    def _protected_hash(self, pdf_path: Path) -> Optional[str]:
+        """Hash of a protected PDF (None if unprotected), cached per path and modification time."""
+        key = self._protection_key(pdf_path) or (str(pdf_path), None)
+        if key not in self._hash_cache:
+            self._hash_cache[key] = self.pdf_processor._protected_hash(pdf_path)
+        return self._hash_cache[key]
+    
+    def _get_hash_file(self, pdf_path: Path, hash_output: str) -> str:
+        """Return a hash file for the PDF, writing hash_output when the PDF is new or changed."""
+        key = self._protection_key(pdf_path) or (str(pdf_path), None)
+        cached = self._hash_files.get(str(pdf_path))
+        
+        if cached is not None:
+            cached_key, hash_file_path = cached
+            if cached_key == key:
+                return hash_file_path
+            
+            # The PDF was replaced since its hash was extracted
+            del self._hash_files[str(pdf_path)]
+            if os.path.exists(hash_file_path):
+                os.unlink(hash_file_path)
+        
+        with tempfile.NamedTemporaryFile(mode='w', suffix='.hash', delete=False) as hash_file:
+            hash_file.write(hash_output)
+            hash_file_path = hash_file.name
+        self._hash_files[str(pdf_path)] = (key, hash_file_path)
+        
+        return hash_file_path
+    
     def get_pdf_info(self, pdf_path: Union[str, Path]) -> dict:
         """Get PDF information including protection status."""
-        return self.pdf_processor.get_pdf_info(pdf_path)
+        info = self.pdf_processor.get_pdf_info(pdf_path)
+        
+        # Remember the extracted hash so a following crack_pdf doesn't run pdf2john again
+        key = self._protection_key(pdf_path)
+        if key is not None and info.get('exists') and 'error' not in info:
+            if not info['protected']:
+                self._hash_cache[key] = None
+            elif info.get('hash'):
+                self._hash_cache[key] = info['hash']
+        
+        return info
     
     def stop(self):
         """Stop any running cracking process."""
-        self.john.stop()
\ No newline at end of file
+        self.john.stop()
+    
+    def cleanup(self):
+        """Remove the temporary hash files created for cracked PDFs."""
+        _remove_hash_files(self._hash_files)
+    
+    def __enter__(self):
+        return self
+    
+    def __exit__(self, exc_type, exc_val, exc_tb):
+        self.cleanup()
\ No newline at end of file
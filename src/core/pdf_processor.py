@@ -2,11 +2,53 @@
 
 import subprocess
 import os
+import glob
 import tempfile
 import shutil
 from pathlib import Path
 from typing import Optional, Union
 
+from .tool_locator import cache_found
+
+
+@cache_found
+def _locate_pdf2john() -> Optional[str]:
+    """Locate the pdf2john script and remember it once found."""
+    # Common paths for pdf2john
+    possible_paths = [
+        '/usr/share/john/pdf2john.pl',
+        '/opt/homebrew/share/john/pdf2john.pl',
+        '/usr/local/share/john/pdf2john.pl',
+        '/opt/homebrew/Cellar/john-jumbo/*/share/john/pdf2john.pl',
+    ]
+    
+    # Check exact paths first
+    for path in possible_paths[:-1]:  # Exclude glob pattern
+        if os.path.exists(path):
+            return path
+    
+    # Check glob pattern
+    glob_matches = glob.glob(possible_paths[-1])
+    if glob_matches:
+        return glob_matches[0]
+    
+    # Try to find using which/whereis
+    try:
+        result = subprocess.run(['which', 'pdf2john'], capture_output=True, text=True)
+        if result.returncode == 0:
+            return result.stdout.strip()
+    except:
+        pass
+    
+    try:
+        result = subprocess.run(['which', 'pdf2john.pl'], capture_output=True, text=True)
+        if result.returncode == 0:
+            return result.stdout.strip()
+    except:
+        pass
+    
+    return None
+
 
 class PDFProcessor:
     """Handle PDF password hash extraction using pdf2john."""
@@ -16,43 +58,12 @@ class PDFProcessor:
     
     def _find_pdf2john(self) -> str:
         """Find pdf2john script on the system."""
-        # Common paths for pdf2john
-        possible_paths = [
-            '/usr/share/john/pdf2john.pl',
-            '/opt/homebrew/share/john/pdf2john.pl',
-            '/usr/local/share/john/pdf2john.pl',
-            '/opt/homebrew/Cellar/john-jumbo/*/share/john/pdf2john.pl',
-        ]
-        
-        # Check exact paths first
-        for path in possible_paths[:-1]:  # Exclude glob pattern
-            if os.path.exists(path):
-                return path
-        
-        # Check glob pattern
-        import glob
-        glob_matches = glob.glob(possible_paths[-1])
-        if glob_matches:
-            return glob_matches[0]
-        
-        # Try to find using which/whereis
-        try:
-            result = subprocess.run(['which', 'pdf2john'], capture_output=True, text=True)
-            if result.returncode == 0:
-                return result.stdout.strip()
-        except:
-            pass
-        
-        try:
-            result = subprocess.run(['which', 'pdf2john.pl'], capture_output=True, text=True)
-            if result.returncode == 0:
-                return result.stdout.strip()
-        except:
-            pass
-        
-        raise FileNotFoundError(
-            "pdf2john script not found. Please ensure John the Ripper is properly installed."
-        )
+        pdf2john_path = _locate_pdf2john()
+        if pdf2john_path is None:
+            raise FileNotFoundError(
+                "pdf2john script not found. Please ensure John the Ripper is properly installed."
+            )
+        return pdf2john_path
     
     def extract_hash(self, pdf_path: Union[str, Path]) -> str:
         """
@@ -131,14 +142,20 @@ class PDFProcessor:
         Returns:
             True if password protected, False otherwise
         """
+        return self._protected_hash(pdf_path) is not None
+    
+    def _protected_hash(self, pdf_path: Union[str, Path]) -> Optional[str]:
+        """Extract the hash once, returning it only if the PDF is password protected."""
         try:
             hash_output = self.extract_hash(pdf_path)
             # Check if we get a valid hash (not the "not encrypted!" message)
             hash_output = hash_output.strip()
-            return bool(hash_output) and "not encrypted" not in hash_output.lower()
+            if hash_output and "not encrypted" not in hash_output.lower():
+                return hash_output
+            return None
         except:
             # If extraction fails, assume not protected or invalid PDF
-            return False
+            return None
     
     def get_pdf_info(self, pdf_path: Union[str, Path]) -> dict:
         """
@@ -162,9 +179,9 @@ class PDFProcessor:
         
         if info['exists']:
             try:
-                info['protected'] = self.is_pdf_protected(pdf_path)
-                if info['protected']:
-                    info['hash'] = self.extract_hash(pdf_path)
+                # One pdf2john run answers both questions
+                info['hash'] = self._protected_hash(pdf_path)
+                info['protected'] = info['hash'] is not None
             except Exception as e:
                 info['error'] = str(e)
         
@@ -213,9 +230,11 @@ class PDFHashManager:
         """
         combined_file = self.temp_dir / "combined_hashes.txt"
         
-        with open(combined_file, 'w') as f:
-            for name, info in self.hash_files.items():
-                f.write(info['hash'] + '\n')
+        # Hashes are kept in memory by add_pdf, so the file is written in one go
+        with open(combined_file, 'wb') as f:
+            f.write(b''.join(
+                info['hash'].encode() + b'\n' for info in self.hash_files.values()
+            ))
         
         return str(combined_file)
     
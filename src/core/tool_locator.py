@@ -0,0 +1,60 @@
+#!/usr/bin/env python3
+"""
+Shared helpers for locating the external tools (john, crunch, pdf2john).
+"""
+
+import os
+import shutil
+from functools import wraps
+from typing import Callable, Iterable, Optional
+
+
+def cache_found(locate: Callable[[], Optional[str]]) -> Callable[[], Optional[str]]:
+    """
+    Cache a tool locator's result once the tool has been found.
+    
+    A miss (None) is not cached, so a tool installed while the process is
+    running is picked up by the next lookup.
+    
+    Args:
+        locate: Function returning the tool path, or None if not found
+    
+    Returns:
+        Wrapped locator with a cache_clear() method
+    """
+    found = []
+    
+    @wraps(locate)
+    def wrapper() -> Optional[str]:
+        if not found:
+            path = locate()
+            if path is None:
+                return None
+            found.append(path)
+        return found[0]
+    
+    wrapper.cache_clear = found.clear
+    return wrapper
+
+
+def find_executable(name: str, fallback_paths: Iterable[str]) -> Optional[str]:
+    """
+    Find an executable on PATH or in one of the given locations.
+    
+    Args:
+        name: Executable name to look up on PATH
+        fallback_paths: Install locations to check if it is not on PATH
+        
+    Returns:
+        Path to the executable, or None if not found
+    """
+    path = shutil.which(name)
+    if path:
+        return path
+    
+    # Fall back to common install locations that may not be on PATH
+    for path in fallback_paths:
+        if os.path.exists(path):
+            return path
+    
+    return None
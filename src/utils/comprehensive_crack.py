@@ -235,6 +235,8 @@ Examples:
     except Exception as e:
         print(f"💥 Cracking error: {e}")
         return 1
+    finally:
+        cracker.cleanup()
 
 if __name__ == "__main__":
     sys.exit(main())
\ No newline at end of file
@@ -17,6 +17,10 @@ from core.crunch_wrapper import CrunchWrapper
 from core.custom_wordlist_generators import CustomWordlistGenerator
 
 
+# Buffer size for the merged wordlist and its parts
+_IO_BUFFER_SIZE = 1 << 20
+
+
 def calculate_comprehensive_stats(years_back: int):
     """Calculate comprehensive wordlist statistics."""
     from datetime import datetime
@@ -25,12 +29,7 @@ def calculate_comprehensive_stats(years_back: int):
     start_year = current_year - years_back
     
     # Calculate Gregorian dates
-    gregorian_days = 0
-    for year in range(start_year, current_year + 1):
-        if (year % 4 == 0 and year % 100 != 0) or (year % 400 == 0):
-            gregorian_days += 366
-        else:
-            gregorian_days += 365
+    gregorian_days = CustomWordlistGenerator().calculate_date_count(start_year, current_year)
     
     # Calculate Buddhist dates (same count, +543 years)
     buddhist_days = gregorian_days
@@ -50,6 +49,28 @@ def calculate_comprehensive_stats(years_back: int):
     }
 
 
+def append_wordlist(output_file, part_path) -> int:
+    """
+    Append a wordlist part to an open binary output file in large chunks.
+    
+    Args:
+        output_file: Destination file opened in binary mode
+        part_path: Path of the wordlist part to copy
+        
+    Returns:
+        Number of lines copied
+    """
+    lines = 0
+    with open(part_path, 'rb') as part_file:
+        while True:
+            chunk = part_file.read(_IO_BUFFER_SIZE)
+            if not chunk:
+                break
+            output_file.write(chunk)
+            lines += chunk.count(b'\n')
+    return lines
+
+
 def main():
     parser = argparse.ArgumentParser(
         description='Generate comprehensive PDF password wordlist',
@@ -137,24 +158,28 @@ Examples:
         print(f"\n🚀 Starting comprehensive wordlist generation...")
         
         crunch = CrunchWrapper()
+        dates = CustomWordlistGenerator()
         total_written = 0
         
         def progress_callback(progress: float, message: str):
             print(f"📊 {progress:.1f}% - {message}")
         
         # Generate in parts and combine
-        with open(output_path, 'w') as final_file:
-            # 1. Gregorian dates
-            print("📅 Generating Gregorian dates...")
+        with open(output_path, 'wb', buffering=_IO_BUFFER_SIZE) as final_file:
+            # 1-2. Gregorian and Buddhist (Gregorian + 543 years) dates in one pass
+            print("📅 Generating Gregorian and Buddhist dates...")
             with tempfile.NamedTemporaryFile(mode='w+', delete=False) as temp_file:
-                temp_path = temp_file.name
+                gregorian_path = temp_file.name
+            with tempfile.NamedTemporaryFile(mode='w+', delete=False) as temp_file:
+                buddhist_path = temp_file.name
             
             from datetime import datetime
             current_year = datetime.now().year
             start_year = current_year - args.years_back
             
-            success = crunch.generate_date_wordlist(
-                temp_path,
+            success = dates.generate_both(
+                gregorian_path,
+                buddhist_path,
                 start_year,
                 current_year,
                 "DDMMYYYY",
@@ -162,36 +187,12 @@ Examples:
             )
             
             if success:
-                with open(temp_path, 'r') as temp_file:
-                    for line in temp_file:
-                        final_file.write(line)
-                        total_written += 1
-                os.unlink(temp_path)
-            else:
-                print("❌ Failed to generate Gregorian dates")
-                return 1
-            
-            # 2. Buddhist dates (Gregorian + 543 years)
-            print("🧘 Generating Buddhist dates...")
-            with tempfile.NamedTemporaryFile(mode='w+', delete=False) as temp_file:
-                temp_path = temp_file.name
-            
-            success = crunch.generate_date_wordlist(
-                temp_path,
-                start_year + 543,  # Buddhist years
-                current_year + 543,
-                "DDMMYYYY",
-                progress_callback
-            )
-            
-            if success:
-                with open(temp_path, 'r') as temp_file:
-                    for line in temp_file:
-                        final_file.write(line)
-                        total_written += 1
-                os.unlink(temp_path)
+                total_written += append_wordlist(final_file, gregorian_path)
+                total_written += append_wordlist(final_file, buddhist_path)
+                os.unlink(gregorian_path)
+                os.unlink(buddhist_path)
             else:
-                print("❌ Failed to generate Buddhist dates")
+                print("❌ Failed to generate Gregorian and Buddhist dates")
                 return 1
             
             # 3. All 8-digit numbers
@@ -208,10 +209,7 @@ Examples:
             )
             
             if success:
-                with open(temp_path, 'r') as temp_file:
-                    for line in temp_file:
-                        final_file.write(line)
-                        total_written += 1
+                total_written += append_wordlist(final_file, temp_path)
                 os.unlink(temp_path)
             else:
                 print("❌ Failed to generate 8-digit numbers")
@@ -18,13 +18,7 @@ from core.custom_wordlist_generators import CustomWordlistGenerator
 
 def calculate_date_count(start_year: int, end_year: int) -> int:
     """Calculate number of valid dates in range."""
-    total_days = 0
-    for year in range(start_year, end_year + 1):
-        if (year % 4 == 0 and year % 100 != 0) or (year % 400 == 0):
-            total_days += 366  # Leap year
-        else:
-            total_days += 365
-    return total_days
+    return CustomWordlistGenerator().calculate_date_count(start_year, end_year)
 
 
 def main():
@@ -41,6 +35,9 @@ Examples:
   
   Show size estimate without generating:
     python wordlist_gen.py --start 2020 --end 2025 --estimate-only
+  
+  Show the estimate with per-year counts:
+    python wordlist_gen.py --start 2020 --end 2025 --estimate-only --breakdown
         """
     )
     
@@ -78,6 +75,18 @@ Examples:
         help='Only show size estimate without generating'
     )
     
+    parser.add_argument(
+        '--breakdown',
+        action='store_true',
+        help='Also show the password count for each year'
+    )
+    
+    parser.add_argument(
+        '--yes', '-y',
+        action='store_true',
+        help='Overwrite an existing output file without asking'
+    )
+    
     args = parser.parse_args()
     
     try:
@@ -96,12 +105,17 @@ Examples:
         print(f"   🔢 Total passwords: {total_passwords:,}")
         print(f"   📏 Estimated file size: {file_size_mb:.1f} MB")
         
+        if args.breakdown:
+            print(f"   🗓️  Per-year breakdown:")
+            for year in range(args.start, args.end + 1):
+                print(f"      {year}: {calculate_date_count(year, year):,}")
+        
         if args.estimate_only:
             print("\n✅ Estimate only - no file generated.")
             return 0
         
         # Check if output file exists
-        if os.path.exists(args.output):
+        if os.path.exists(args.output) and not args.yes:
             response = input(f"\n⚠️  File '{args.output}' already exists. Overwrite? (y/N): ")
             if response.lower() not in ['y', 'yes']:
                 print("❌ Cancelled.")
@@ -4,8 +4,6 @@ Pytest configuration and shared fixtures for PDF Cracker tests.
 """
 
 import sys
-import os
-import tempfile
 from pathlib import Path
 import pytest
 
@@ -15,20 +13,44 @@ sys.path.insert(0, str(src_dir))
 
 
 @pytest.fixture
-def temp_file():
-    """Create a temporary file for testing."""
-    with tempfile.NamedTemporaryFile(delete=False) as f:
-        temp_path = f.name
-    yield temp_path
-    if os.path.exists(temp_path):
-        os.unlink(temp_path)
+def temp_file(tmp_path):
+    """Create an empty temporary file for testing (removed with tmp_path)."""
+    temp_path = tmp_path / 'temp_file'
+    temp_path.touch()
+    return str(temp_path)
 
 
 @pytest.fixture
-def temp_directory():
-    """Create a temporary directory for testing."""
-    with tempfile.TemporaryDirectory() as temp_dir:
-        yield temp_dir
+def temp_directory(tmp_path):
+    """Create a temporary directory for testing (removed with tmp_path)."""
+    temp_dir = tmp_path / 'temp_directory'
+    temp_dir.mkdir()
+    return str(temp_dir)
+
+
+@pytest.fixture
+def clear_tool_caches():
+    """Reset the cached john, crunch and pdf2john lookups around a test."""
+    from core.john_wrapper import _locate_john
+    from core.crunch_wrapper import _locate_crunch
+    from core.pdf_processor import _locate_pdf2john
+    
+    locators = (_locate_john, _locate_crunch, _locate_pdf2john)
+    for locate in locators:
+        locate.cache_clear()
+    yield
+    for locate in locators:
+        locate.cache_clear()
+
+
+@pytest.fixture(scope='session')
+def wordlist_2023_ddmmyyyy(tmp_path_factory):
+    """Generate the 2023 DDMMYYYY date wordlist once per test session."""
+    from core.custom_wordlist_generators import DateWordlistGenerator
+    
+    wordlist_path = tmp_path_factory.mktemp('wordlists') / 'dates_2023_ddmmyyyy.txt'
+    assert DateWordlistGenerator().generate_date_wordlist(wordlist_path, 2023, 2023, "DDMMYYYY")
+    return wordlist_path
 
 
 @pytest.fixture
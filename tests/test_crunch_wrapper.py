@@ -4,13 +4,9 @@ Tests for Crunch wrapper module - focuses on number generation only.
 """
 
 import os
-import sys
 from unittest.mock import patch
 import pytest
 
-# Add src to path
-sys.path.insert(0, os.path.join(os.path.dirname(__file__), '..', 'src'))
-
 from core.crunch_wrapper import CrunchWrapper
 
 
@@ -24,29 +20,35 @@ class TestCrunchWrapper:
             mock_find.return_value = '/usr/bin/crunch'
             return CrunchWrapper()
     
-    def test_find_crunch_existing_path(self):
+    def test_find_crunch_existing_path(self, clear_tool_caches):
         """Test finding crunch when it exists."""
-        with patch('os.path.exists') as mock_exists, \
-             patch('subprocess.run') as mock_run:
+        with patch('shutil.which', return_value=None), \
+             patch('os.path.exists') as mock_exists:
             
             mock_exists.side_effect = lambda path: path == '/usr/bin/crunch'
-            mock_run.return_value.returncode = 0
             
             crunch = CrunchWrapper()
-            assert crunch.crunch_path is not None
+            assert crunch.crunch_path == '/usr/bin/crunch'
             assert crunch.has_crunch
     
-    def test_find_crunch_not_found(self):
+    def test_find_crunch_not_found(self, clear_tool_caches):
         """Test crunch not found scenario."""
-        with patch('os.path.exists', return_value=False), \
-             patch('subprocess.run') as mock_run:
-            
-            mock_run.return_value.returncode = 1
+        with patch('shutil.which', return_value=None), \
+             patch('os.path.exists', return_value=False):
             
             crunch = CrunchWrapper()
             assert crunch.crunch_path is None
             assert not crunch.has_crunch
     
+    def test_find_crunch_cached(self, clear_tool_caches):
+        """Test the crunch lookup runs once across CrunchWrapper instances."""
+        with patch('shutil.which', return_value='/usr/local/bin/crunch') as mock_which:
+            first = CrunchWrapper()
+            second = CrunchWrapper()
+            
+            assert first.crunch_path == second.crunch_path == '/usr/local/bin/crunch'
+            mock_which.assert_called_once()
+    
     @patch('subprocess.run')
     def test_generate_number_range_with_crunch(self, mock_run, temp_file):
         """Test number range generation using crunch."""
@@ -132,6 +134,29 @@ class TestCrunchWrapper:
         assert first_line == f"{min_num:0{digits}d}"
         assert last_line == f"{max_num:0{digits}d}"
     
+    @pytest.mark.parametrize("min_num,max_num,digits", [
+        (0, 99, 2),                # Low-digit table only
+        (9990, 10010, 4),          # Crosses a 10**4 prefix boundary
+        (123450, 123560, 6),       # Zero-padded high prefix
+        (99995, 100005, 5),        # Numbers wider than digits
+        (12345, 12350, 2),         # Every number wider than digits
+        (0, 100005, 3),            # Crosses a 100,000-number chunk boundary
+        (-5, 5, 2),                # Negative numbers
+        (7, 7, 0),                 # No padding
+    ])
+    def test_python_fallback_matches_reference(self, temp_file, min_num, max_num, digits):
+        """Test the Python fallback writes exactly the f-string formatted numbers."""
+        crunch = CrunchWrapper()
+        crunch.has_crunch = False
+        
+        result = crunch.generate_number_range(temp_file, min_num, max_num, digits)
+        
+        assert result
+        
+        expected = "".join(f"{n:0{digits}d}\n" for n in range(min_num, max_num + 1))
+        with open(temp_file, 'r') as f:
+            assert f.read() == expected
+    
     @patch('subprocess.run')
     def test_crunch_command_failure_fallback(self, mock_run, temp_file):
         """Test fallback to Python when crunch command fails."""
@@ -177,16 +202,18 @@ class TestCrunchWrapper:
         assert hasattr(crunch, 'has_crunch')
         assert isinstance(crunch.has_crunch, bool)
     
-    @patch('subprocess.run')
-    def test_crunch_which_command_check(self, mock_run):
-        """Test crunch path detection using which command."""
-        # Simulate crunch found via 'which' command
-        mock_run.return_value.returncode = 0
-        
-        with patch('os.path.exists', return_value=False):
+    def test_crunch_which_command_check(self, clear_tool_caches):
+        """Test crunch path detection using a PATH lookup."""
+        with patch('shutil.which', return_value='/usr/local/bin/crunch') as mock_which, \
+             patch('os.path.exists', return_value=False) as mock_exists, \
+             patch('subprocess.run') as mock_run:
+            
             crunch = CrunchWrapper()
-            # Should find crunch via which command even if not in standard paths
-            assert mock_run.called
+            # Found on PATH even if not in the standard locations, without spawning 'which'
+            assert crunch.crunch_path == '/usr/local/bin/crunch'
+            mock_which.assert_called_once_with('crunch')
+            mock_exists.assert_not_called()
+            mock_run.assert_not_called()
 
 
 if __name__ == '__main__':
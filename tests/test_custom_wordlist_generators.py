@@ -3,15 +3,11 @@
 Tests for custom wordlist generators module.
 """
 
-import tempfile
+import io
 import os
-import sys
 from pathlib import Path
 import pytest
 
-# Add src to path
-sys.path.insert(0, os.path.join(os.path.dirname(__file__), '..', 'src'))
-
 from core.custom_wordlist_generators import CustomWordlistGenerator, DateWordlistGenerator
 
 
@@ -23,16 +19,11 @@ class TestDateWordlistGenerator:
         """Create DateWordlistGenerator instance."""
         return DateWordlistGenerator()
     
-    def test_generate_date_wordlist_ddmmyyyy(self, date_generator, temp_file):
+    def test_generate_date_wordlist_ddmmyyyy(self, wordlist_2023_ddmmyyyy):
         """Test date wordlist generation in DDMMYYYY format."""
-        result = date_generator.generate_date_wordlist(
-            temp_file, 2023, 2023, "DDMMYYYY"
-        )
-        
-        assert result
-        assert os.path.exists(temp_file)
+        assert os.path.exists(wordlist_2023_ddmmyyyy)
         
-        with open(temp_file, 'r') as f:
+        with open(wordlist_2023_ddmmyyyy, 'r') as f:
             lines = f.readlines()
         
         assert len(lines) == 365  # 2023 is not a leap year
@@ -58,6 +49,32 @@ class TestDateWordlistGenerator:
         assert len(first_line) == expected_length
         assert first_line == expected_first
     
+    @pytest.mark.parametrize("date_format", ["DDMMYYYY", "DDMMYY", "YYYYMMDD"])
+    def test_date_formats_match_reference(self, date_generator, date_format):
+        """Test every generated date matches plain f-string formatting."""
+        from datetime import date, timedelta
+        
+        output = io.BytesIO()
+        result = date_generator.generate_date_wordlist(
+            output, 2024, 2024, date_format
+        )
+        
+        assert result
+        
+        expected = []
+        current = date(2024, 1, 1)
+        while current.year == 2024:
+            d, m, y = current.day, current.month, current.year
+            if date_format == "DDMMYYYY":
+                expected.append(f"{d:02d}{m:02d}{y}")
+            elif date_format == "DDMMYY":
+                expected.append(f"{d:02d}{m:02d}{y % 100:02d}")
+            else:
+                expected.append(f"{y}{m:02d}{d:02d}")
+            current += timedelta(days=1)
+        
+        assert output.getvalue().decode().splitlines() == expected
+    
     def test_generate_date_wordlist_invalid_format(self, date_generator, temp_file):
         """Test invalid date format."""
         result = date_generator.generate_date_wordlist(
@@ -72,22 +89,35 @@ class TestDateWordlistGenerator:
         (2000, 366),   # Leap year (divisible by 400)
         (1900, 365),   # Not leap year (divisible by 100 but not 400)
     ])
-    def test_leap_year_handling(self, date_generator, temp_file, year, expected_days):
+    def test_leap_year_handling(self, date_generator, year, expected_days):
         """Test proper leap year handling in date generation."""
-        result = date_generator.generate_date_wordlist(temp_file, year, year, "DDMMYYYY")
+        output = io.BytesIO()
+        result = date_generator.generate_date_wordlist(output, year, year, "DDMMYYYY")
         
         assert result
+        assert not output.closed  # Caller-owned streams are left open
         
-        with open(temp_file, 'r') as f:
-            lines = f.readlines()
+        lines = output.getvalue().decode().splitlines()
         
         # Just verify correct number of dates generated
         assert len(lines) == expected_days
         
         # Verify Feb 28 is always present
-        feb28 = f"2802{year}"
-        content = ''.join(lines)
-        assert feb28 in content
+        assert f"2802{year}" in lines
+    
+    def test_long_range_is_chronological(self, date_generator, temp_file):
+        """Test multi-century ranges are complete and written in calendar order."""
+        result = date_generator.generate_date_wordlist(temp_file, 1899, 2101, "YYYYMMDD")
+        
+        assert result
+        
+        with open(temp_file, 'r') as f:
+            lines = f.read().splitlines()
+        
+        assert len(lines) == CustomWordlistGenerator().calculate_date_count(1899, 2101)
+        assert lines == sorted(set(lines))
+        assert lines[0] == "18990101"
+        assert lines[-1] == "21011231"
     
     def test_generate_date_wordlist_with_progress(self, date_generator, temp_file):
         """Test date wordlist generation with progress callback."""
@@ -111,6 +141,22 @@ class TestDateWordlistGenerator:
         assert last_progress == 100
         assert "complete" in last_message.lower()
     
+    def test_progress_updates_are_coarse(self, date_generator, temp_file):
+        """Test long ranges report at most one update per whole percent."""
+        progress_calls = []
+        
+        def progress_callback(progress, message):
+            progress_calls.append((progress, message))
+        
+        result = date_generator.generate_date_wordlist(
+            temp_file, 1000, 2999, "DDMMYYYY", progress_callback
+        )
+        
+        assert result
+        assert len(progress_calls) <= 102
+        assert progress_calls[0][0] == 0
+        assert progress_calls[-1][0] == 100
+    
     def test_generate_buddhist_dates(self, date_generator, temp_file):
         """Test Buddhist calendar date generation."""
         result = date_generator.generate_buddhist_dates(
@@ -147,6 +193,24 @@ class TestDateWordlistGenerator:
         expected_first = f"0101{buddhist_year}"
         assert first_line == expected_first
     
+    @pytest.mark.parametrize("date_format,expected_first,expected_last", [
+        ("DDMMYY", "010166", "311266"),
+        ("YYYYMMDD", "25660101", "25661231"),
+    ])
+    def test_buddhist_date_formats(self, date_generator, temp_file, date_format, expected_first, expected_last):
+        """Test Buddhist dates in the other supported formats."""
+        result = date_generator.generate_buddhist_dates(
+            temp_file, 2023, 2023, date_format
+        )
+        
+        assert result
+        
+        with open(temp_file, 'r') as f:
+            lines = f.read().splitlines()
+        
+        assert lines[0] == expected_first
+        assert lines[-1] == expected_last
+    
     def test_generate_buddhist_dates_with_progress(self, date_generator, temp_file):
         """Test Buddhist date generation with progress callback."""
         progress_calls = []
@@ -165,6 +229,21 @@ class TestDateWordlistGenerator:
         last_progress, last_message = progress_calls[-1]
         assert last_progress == 100
         assert "complete" in last_message.lower()
+    
+    def test_generate_both_matches_separate_runs(self, date_generator, temp_directory):
+        """Test the fused pass writes the same files as separate runs."""
+        both_gregorian = Path(temp_directory) / 'both_gregorian.txt'
+        both_buddhist = Path(temp_directory) / 'both_buddhist.txt'
+        gregorian = Path(temp_directory) / 'gregorian.txt'
+        buddhist = Path(temp_directory) / 'buddhist.txt'
+        
+        assert date_generator.generate_both(both_gregorian, both_buddhist, 2023, 2024, "DDMMYYYY")
+        assert date_generator.generate_date_wordlist(gregorian, 2023, 2024, "DDMMYYYY")
+        assert date_generator.generate_buddhist_dates(buddhist, 2023, 2024, "DDMMYYYY")
+        
+        assert both_gregorian.read_bytes() == gregorian.read_bytes()
+        assert both_buddhist.read_bytes() == buddhist.read_bytes()
+        assert len(both_buddhist.read_bytes().splitlines()) == 365 + 366
 
 
 class TestCustomWordlistGenerator:
@@ -175,7 +254,7 @@ class TestCustomWordlistGenerator:
         """Create CustomWordlistGenerator instance."""
         return CustomWordlistGenerator()
     
-    def test_generate_date_wordlist_delegation(self, custom_generator, temp_file):
+    def test_generate_date_wordlist_delegation(self, custom_generator, temp_file, wordlist_2023_ddmmyyyy):
         """Test that CustomWordlistGenerator properly delegates to DateWordlistGenerator."""
         result = custom_generator.generate_date_wordlist(
             temp_file, 2023, 2023, "DDMMYYYY"
@@ -184,11 +263,8 @@ class TestCustomWordlistGenerator:
         assert result
         assert os.path.exists(temp_file)
         
-        with open(temp_file, 'r') as f:
-            lines = f.readlines()
-        
-        assert len(lines) == 365
-        assert lines[0].strip() == "01012023"
+        with open(temp_file, 'rb') as f:
+            assert f.read() == wordlist_2023_ddmmyyyy.read_bytes()
     
     def test_generate_buddhist_dates_delegation(self, custom_generator, temp_file):
         """Test that CustomWordlistGenerator properly delegates Buddhist date generation."""
@@ -209,6 +285,8 @@ class TestCustomWordlistGenerator:
         (2020, 2020, 366),  # Leap year
         (2021, 2021, 365),  # Not leap year
         (2020, 2021, 366 + 365),  # Multiple years
+        (1900, 2000, 101 * 365 + 25),  # Century boundaries (1900 common, 2000 leap)
+        (2025, 2020, 0),  # Reversed range
     ])
     def test_calculate_date_count(self, custom_generator, start_year, end_year, expected):
         """Test date calculation function."""
@@ -224,21 +302,15 @@ class TestCustomWordlistGenerator:
 class TestWordlistGeneratorIntegration:
     """Integration tests for wordlist generators."""
     
-    def test_date_generator_standalone(self):
+    def test_date_generator_standalone(self, tmp_path):
         """Test that DateWordlistGenerator can be used standalone."""
         generator = DateWordlistGenerator()
         assert generator is not None
         
-        with tempfile.NamedTemporaryFile(mode='w', delete=False) as temp_file:
-            temp_path = temp_file.name
-        
-        try:
-            result = generator.generate_date_wordlist(temp_path, 2023, 2023, "DDMMYYYY")
-            assert result
-            assert os.path.exists(temp_path)
-        finally:
-            if os.path.exists(temp_path):
-                os.unlink(temp_path)
+        temp_path = tmp_path / "dates.txt"
+        result = generator.generate_date_wordlist(temp_path, 2023, 2023, "DDMMYYYY")
+        assert result
+        assert temp_path.exists()
     
     def test_custom_generator_composition(self):
         """Test that CustomWordlistGenerator properly composes DateWordlistGenerator."""
@@ -248,6 +320,7 @@ class TestWordlistGeneratorIntegration:
         # Both should provide the same interface
         assert hasattr(custom_gen, 'generate_date_wordlist')
         assert hasattr(custom_gen, 'generate_buddhist_dates')
+        assert hasattr(custom_gen, 'generate_both')
         assert hasattr(custom_gen, 'calculate_date_count')
         
         assert hasattr(date_gen, 'generate_date_wordlist')
@@ -264,21 +337,11 @@ class TestWordlistGeneratorIntegration:
         
         expected_count = generator.calculate_date_count(start_year, current_year)
         
-        with tempfile.NamedTemporaryFile(mode='w', delete=False) as temp_file:
-            temp_path = temp_file.name
-        
-        try:
-            result = generator.generate_date_wordlist(temp_path, start_year, current_year, "DDMMYYYY")
-            assert result
-            
-            with open(temp_path, 'r') as f:
-                lines = f.readlines()
-            
-            assert len(lines) == expected_count
-            
-        finally:
-            if os.path.exists(temp_path):
-                os.unlink(temp_path)
+        output = io.BytesIO()
+        result = generator.generate_date_wordlist(output, start_year, current_year, "DDMMYYYY")
+        assert result
+        
+        assert output.getvalue().count(b"\n") == expected_count
 
 
 if __name__ == '__main__':
@@ -6,14 +6,11 @@ Tests for John the Ripper wrapper module.
 import tempfile
 import os
 from pathlib import Path
-import sys
 from unittest.mock import patch, MagicMock
 import pytest
 
-# Add src to path
-sys.path.insert(0, os.path.join(os.path.dirname(__file__), '..', 'src'))
-
 from core.john_wrapper import JohnWrapper, PDFCracker, CrackResult
+from core.pdf_processor import PDFProcessor
 
 
 class TestCrackResult:
@@ -60,27 +57,42 @@ class TestJohnWrapper:
             mock_find.return_value = '/usr/bin/john'
             return JohnWrapper()
     
-    def test_find_john_existing_path(self):
+    def test_find_john_existing_path(self, clear_tool_caches):
         """Test finding John when it exists."""
-        with patch('os.path.exists') as mock_exists, \
-             patch('subprocess.run') as mock_run:
+        with patch('shutil.which', return_value=None), \
+             patch('os.path.exists') as mock_exists:
             
             mock_exists.side_effect = lambda path: path == '/usr/bin/john'
-            mock_run.return_value.returncode = 0
             
             john = JohnWrapper()
-            assert john.john_path is not None
+            assert john.john_path == '/usr/bin/john'
     
-    def test_find_john_not_found(self):
-        """Test John not found scenario."""
-        with patch('os.path.exists', return_value=False), \
-             patch('subprocess.run') as mock_run:
+    def test_find_john_on_path(self, clear_tool_caches):
+        """Test John found on PATH skips the fallback locations."""
+        with patch('shutil.which', return_value='/usr/local/bin/john'), \
+             patch('os.path.exists') as mock_exists:
             
-            mock_run.return_value.returncode = 1
+            john = JohnWrapper()
+            assert john.john_path == '/usr/local/bin/john'
+            mock_exists.assert_not_called()
+    
+    def test_find_john_not_found(self, clear_tool_caches):
+        """Test John not found scenario."""
+        with patch('shutil.which', return_value=None), \
+             patch('os.path.exists', return_value=False):
             
             with pytest.raises(FileNotFoundError):
                 JohnWrapper()
     
+    def test_find_john_cached(self, clear_tool_caches):
+        """Test John is located once and reused by later instances."""
+        with patch('shutil.which', return_value='/usr/bin/john') as mock_which:
+            first = JohnWrapper()
+            second = JohnWrapper()
+            
+            assert first.john_path == second.john_path
+            mock_which.assert_called_once()
+    
     @patch('subprocess.Popen')
     def test_crack_hash_success(self, mock_popen, john_wrapper, temp_file):
         """Test successful hash cracking."""
@@ -116,24 +128,39 @@ class TestJohnWrapper:
             assert result.password is None
             assert "Error:" in result.error
     
-    @patch('subprocess.run')
-    def test_get_cracked_password_success(self, mock_run, john_wrapper, temp_file):
+    @patch('subprocess.Popen')
+    def test_get_cracked_password_success(self, mock_popen, john_wrapper, temp_file):
         """Test extracting cracked password."""
-        mock_run.return_value.stdout = "test.pdf:password123\n1 password hash cracked"
-        mock_run.return_value.returncode = 0
+        mock_process = mock_popen.return_value.__enter__.return_value
+        mock_process.stdout = iter(["test.pdf:password123\n", "1 password hash cracked\n"])
+        mock_process.poll.return_value = 0
         
         password = john_wrapper._get_cracked_password(temp_file)
         assert password == "password123"
     
-    @patch('subprocess.run')
-    def test_get_cracked_password_no_result(self, mock_run, john_wrapper, temp_file):
+    @patch('subprocess.Popen')
+    def test_get_cracked_password_no_result(self, mock_popen, john_wrapper, temp_file):
         """Test extracting password when none found."""
-        mock_run.return_value.stdout = ""
-        mock_run.return_value.returncode = 0
+        mock_process = mock_popen.return_value.__enter__.return_value
+        mock_process.stdout = iter([])
+        mock_process.poll.return_value = 0
         
         password = john_wrapper._get_cracked_password(temp_file)
         assert password is None
     
+    @patch('subprocess.Popen')
+    def test_get_cracked_password_stops_after_first_line(self, mock_popen, john_wrapper, temp_file):
+        """Test the potfile output is not read past the first entry."""
+        mock_process = mock_popen.return_value.__enter__.return_value
+        output = iter(["0 password hashes cracked, 1 left\n", "unread line\n"])
+        mock_process.stdout = output
+        mock_process.poll.return_value = None
+        
+        password = john_wrapper._get_cracked_password(temp_file)
+        assert password is None
+        assert next(output) == "unread line\n"
+        mock_process.terminate.assert_called_once()
+    
     def test_stop_cracking(self, john_wrapper):
         """Test stopping cracking process."""
         mock_process = MagicMock()
@@ -168,7 +195,7 @@ class TestPDFCracker:
     def test_crack_pdf_not_protected(self, mock_exists, pdf_cracker):
         """Test cracking unprotected PDF."""
         mock_exists.return_value = True
-        pdf_cracker.pdf_processor.is_pdf_protected.return_value = False
+        pdf_cracker.pdf_processor._protected_hash.return_value = None
         
         result = pdf_cracker.crack_pdf("test.pdf", "wordlist.txt")
         
@@ -190,8 +217,7 @@ class TestPDFCracker:
         mock_hash_file.name = "/tmp/test.hash"
         mock_temp.return_value.__enter__.return_value = mock_hash_file
         
-        pdf_cracker.pdf_processor.is_pdf_protected.return_value = True
-        pdf_cracker.pdf_processor.extract_hash.return_value = "test.pdf:$pdf$..."
+        pdf_cracker.pdf_processor._protected_hash.return_value = "test.pdf:$pdf$..."
         
         mock_result = CrackResult(success=True, password="12345678", time_taken=10.0)
         with patch.object(pdf_cracker.john, 'crack_hash') as mock_crack:
@@ -202,6 +228,67 @@ class TestPDFCracker:
             assert result.success
             assert result.password == "12345678"
     
+    @patch('pathlib.Path.exists')
+    def test_crack_pdf_reuses_hash_file(self, mock_exists, pdf_cracker):
+        """Test the hash is extracted once per PDF across wordlists."""
+        mock_exists.return_value = True
+        pdf_cracker.pdf_processor._protected_hash.return_value = "test.pdf:$pdf$..."
+        
+        with patch.object(pdf_cracker.john, 'crack_hash') as mock_crack:
+            mock_crack.return_value = CrackResult(success=False, error="No password found")
+            
+            pdf_cracker.crack_pdf("test.pdf", "dates.txt")
+            pdf_cracker.crack_pdf("test.pdf", "numbers.txt")
+            
+            pdf_cracker.pdf_processor._protected_hash.assert_called_once()
+            first_hash_file = mock_crack.call_args_list[0][0][0]
+            second_hash_file = mock_crack.call_args_list[1][0][0]
+            assert first_hash_file == second_hash_file
+            
+            with open(first_hash_file, 'r') as f:
+                assert f.read() == "test.pdf:$pdf$..."
+        
+        pdf_cracker.cleanup()
+        assert not os.path.exists(first_hash_file)
+    
+    def test_crack_pdf_replaced_pdf_gets_new_hash_file(self, pdf_cracker, sample_pdf_file):
+        """Test a PDF replaced at the same path is re-extracted and the stale hash removed."""
+        pdf_cracker.pdf_processor._protected_hash.side_effect = ["old:$pdf$...", "new:$pdf$..."]
+        
+        with patch.object(pdf_cracker.john, 'crack_hash') as mock_crack:
+            mock_crack.return_value = CrackResult(success=False, error="No password found")
+            
+            pdf_cracker.crack_pdf(sample_pdf_file, "dates.txt")
+            
+            stat = os.stat(sample_pdf_file)
+            os.utime(sample_pdf_file, ns=(stat.st_atime_ns, stat.st_mtime_ns + 1_000_000_000))
+            pdf_cracker.crack_pdf(sample_pdf_file, "dates.txt")
+            
+            old_hash_file = mock_crack.call_args_list[0][0][0]
+            new_hash_file = mock_crack.call_args_list[1][0][0]
+        
+        assert not os.path.exists(old_hash_file)
+        with open(new_hash_file, 'r') as f:
+            assert f.read() == "new:$pdf$..."
+        
+        pdf_cracker.cleanup()
+        assert not os.path.exists(new_hash_file)
+    
+    def test_hash_files_removed_without_cleanup(self):
+        """Test hash files are removed when the cracker is garbage collected."""
+        import gc
+        
+        with patch.object(JohnWrapper, '_find_john', return_value='/usr/bin/john'), \
+             patch('core.john_wrapper.PDFProcessor'):
+            cracker = PDFCracker()
+        
+        hash_file_path = cracker._get_hash_file(Path("test.pdf"), "test.pdf:$pdf$...")
+        assert os.path.exists(hash_file_path)
+        
+        del cracker
+        gc.collect()
+        assert not os.path.exists(hash_file_path)
+    
     @patch('pathlib.Path.exists')
     @patch('tempfile.NamedTemporaryFile')
     def test_crack_pdf_extraction_error(self, mock_temp, mock_exists, pdf_cracker):
@@ -212,14 +299,49 @@ class TestPDFCracker:
         mock_hash_file.name = "/tmp/test.hash"
         mock_temp.return_value.__enter__.return_value = mock_hash_file
         
-        pdf_cracker.pdf_processor.is_pdf_protected.return_value = True
-        pdf_cracker.pdf_processor.extract_hash.side_effect = Exception("Hash extraction failed")
+        pdf_cracker.pdf_processor._protected_hash.side_effect = Exception("Hash extraction failed")
         
         result = pdf_cracker.crack_pdf("test.pdf", "wordlist.txt")
         
         assert not result.success
         assert "Hash extraction failed" in result.error
     
+    def test_protection_check_cached(self, pdf_cracker, sample_pdf_file):
+        """Test protection is checked once per unchanged PDF."""
+        pdf_cracker.pdf_processor._protected_hash.return_value = None
+        
+        pdf_cracker.crack_pdf(sample_pdf_file, "dates.txt")
+        pdf_cracker.crack_pdf(sample_pdf_file, "numbers.txt")
+        pdf_cracker.pdf_processor._protected_hash.assert_called_once()
+        
+        # A modified file is checked again
+        stat = os.stat(sample_pdf_file)
+        os.utime(sample_pdf_file, ns=(stat.st_atime_ns, stat.st_mtime_ns + 1_000_000_000))
+        pdf_cracker.crack_pdf(sample_pdf_file, "dates.txt")
+        assert pdf_cracker.pdf_processor._protected_hash.call_count == 2
+    
+    def test_crack_pdf_extracts_hash_once(self, sample_pdf_file):
+        """Test pdf2john runs once per PDF for crack_pdf, with or without get_pdf_info first."""
+        with patch.object(JohnWrapper, '_find_john', return_value='/usr/bin/john'), \
+             patch.object(PDFProcessor, '_find_pdf2john', return_value='/usr/bin/pdf2john'), \
+             patch.object(PDFProcessor, 'extract_hash', return_value="test.pdf:$pdf$...") as mock_extract, \
+             patch.object(JohnWrapper, 'crack_hash') as mock_crack:
+            
+            mock_crack.return_value = CrackResult(success=False, error="No password found")
+            
+            with PDFCracker() as cracker:
+                cracker.crack_pdf(sample_pdf_file, "dates.txt")
+                mock_extract.assert_called_once()
+            
+            mock_extract.reset_mock()
+            with PDFCracker() as cracker:
+                info = cracker.get_pdf_info(sample_pdf_file)
+                cracker.crack_pdf(sample_pdf_file, "dates.txt")
+                mock_extract.assert_called_once()
+                
+                with open(mock_crack.call_args[0][0], 'r') as f:
+                    assert f.read() == info['hash']
+    
     def test_get_pdf_info(self, pdf_cracker):
         """Test getting PDF information."""
         expected_info = {
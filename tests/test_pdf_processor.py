@@ -3,19 +3,22 @@
 Tests for PDF processor module.
 """
 
-import tempfile
 import os
 from pathlib import Path
-import sys
 from unittest.mock import patch, MagicMock
 import pytest
 
-# Add src to path
-sys.path.insert(0, os.path.join(os.path.dirname(__file__), '..', 'src'))
-
 from core.pdf_processor import PDFProcessor, PDFHashManager
 
 
+@pytest.fixture
+def pdf_path(tmp_path, sample_pdf_content):
+    """Write the sample PDF into the test's temporary directory."""
+    pdf_path = tmp_path / "test.pdf"
+    pdf_path.write_bytes(sample_pdf_content)
+    return str(pdf_path)
+
+
 class TestPDFProcessor:
     """Test the PDFProcessor class."""
     
@@ -26,7 +29,7 @@ class TestPDFProcessor:
             mock_find.return_value = '/opt/homebrew/share/john/pdf2john.pl'
             return PDFProcessor()
     
-    def test_find_pdf2john_existing_path(self):
+    def test_find_pdf2john_existing_path(self, clear_tool_caches):
         """Test finding pdf2john when it exists."""
         with patch('os.path.exists') as mock_exists:
             mock_exists.side_effect = lambda path: path == '/usr/share/john/pdf2john.pl'
@@ -34,7 +37,7 @@ class TestPDFProcessor:
             processor = PDFProcessor()
             assert processor.pdf2john_path == '/usr/share/john/pdf2john.pl'
     
-    def test_find_pdf2john_not_found(self):
+    def test_find_pdf2john_not_found(self, clear_tool_caches):
         """Test pdf2john not found scenario."""
         with patch('os.path.exists', return_value=False), \
              patch('glob.glob', return_value=[]), \
@@ -45,17 +48,27 @@ class TestPDFProcessor:
             with pytest.raises(FileNotFoundError):
                 PDFProcessor()
     
+    def test_find_pdf2john_cached(self, clear_tool_caches):
+        """Test the pdf2john lookup runs once across PDFProcessor instances."""
+        with patch('os.path.exists') as mock_exists:
+            mock_exists.side_effect = lambda path: path == '/usr/share/john/pdf2john.pl'
+            
+            first = PDFProcessor()
+            second = PDFProcessor()
+            
+            assert first.pdf2john_path == second.pdf2john_path == '/usr/share/john/pdf2john.pl'
+            mock_exists.assert_called_once()
+    
     @patch('subprocess.run')
-    def test_extract_hash_success(self, mock_run, processor):
+    def test_extract_hash_success(self, mock_run, processor, pdf_path):
         """Test successful hash extraction."""
         # Mock subprocess result
         mock_run.return_value.returncode = 0
         mock_run.return_value.stdout = "test.pdf:$pdf$4*4*128*-1024*1*16*..."
         mock_run.return_value.stderr = ""
         
-        with tempfile.NamedTemporaryFile(suffix='.pdf') as temp_pdf:
-            result = processor.extract_hash(temp_pdf.name)
-            assert result == "test.pdf:$pdf$4*4*128*-1024*1*16*..."
+        result = processor.extract_hash(pdf_path)
+        assert result == "test.pdf:$pdf$4*4*128*-1024*1*16*..."
     
     @patch('subprocess.run')
     def test_extract_hash_file_not_found(self, mock_run, processor):
@@ -64,150 +77,128 @@ class TestPDFProcessor:
             processor.extract_hash("/non/existent/file.pdf")
     
     @patch('subprocess.run')
-    def test_extract_hash_extraction_failed(self, mock_run, processor):
+    def test_extract_hash_extraction_failed(self, mock_run, processor, pdf_path):
         """Test hash extraction failure."""
         import subprocess
         mock_run.side_effect = subprocess.CalledProcessError(1, 'pdf2john')
         
-        with tempfile.NamedTemporaryFile(suffix='.pdf') as temp_pdf:
-            with pytest.raises(RuntimeError):
-                processor.extract_hash(temp_pdf.name)
+        with pytest.raises(RuntimeError):
+            processor.extract_hash(pdf_path)
     
     @patch('subprocess.run')
-    def test_extract_hash_empty_output(self, mock_run, processor):
+    def test_extract_hash_empty_output(self, mock_run, processor, pdf_path):
         """Test hash extraction with empty output."""
         mock_run.return_value.returncode = 0
         mock_run.return_value.stdout = ""
         mock_run.return_value.stderr = ""
         
-        with tempfile.NamedTemporaryFile(suffix='.pdf') as temp_pdf:
-            with pytest.raises(RuntimeError):
-                processor.extract_hash(temp_pdf.name)
+        with pytest.raises(RuntimeError):
+            processor.extract_hash(pdf_path)
     
     @patch('subprocess.run')
-    def test_save_hash_to_file(self, mock_run, processor, sample_pdf_content):
+    def test_save_hash_to_file(self, mock_run, processor, pdf_path, tmp_path):
         """Test saving hash to file."""
         mock_run.return_value.returncode = 0
         mock_run.return_value.stdout = "test.pdf:$pdf$4*4*128*-1024*1*16*..."
         mock_run.return_value.stderr = ""
         
-        # Create temporary files
-        with tempfile.NamedTemporaryFile(suffix='.pdf', delete=False) as temp_pdf:
-            temp_pdf.write(sample_pdf_content)
-            temp_pdf_path = temp_pdf.name
-            
-        with tempfile.NamedTemporaryFile(mode='w', delete=False) as temp_hash:
-            temp_hash_path = temp_hash.name
-            
-        try:
-            result = processor.save_hash_to_file(temp_pdf_path, temp_hash_path)
-            
-            # Check return value
-            assert result == "test.pdf:$pdf$4*4*128*-1024*1*16*..."
-            
-            # Check file contents
-            with open(temp_hash_path, 'r') as f:
-                content = f.read()
-            assert content.strip() == "test.pdf:$pdf$4*4*128*-1024*1*16*..."
-            
-        finally:
-            if os.path.exists(temp_hash_path):
-                os.unlink(temp_hash_path)
-            if os.path.exists(temp_pdf_path):
-                os.unlink(temp_pdf_path)
+        hash_path = tmp_path / "test.hash"
+        result = processor.save_hash_to_file(pdf_path, hash_path)
+        
+        # Check return value
+        assert result == "test.pdf:$pdf$4*4*128*-1024*1*16*..."
+        
+        # Check file contents
+        assert hash_path.read_text().strip() == "test.pdf:$pdf$4*4*128*-1024*1*16*..."
     
     @patch.object(PDFProcessor, 'extract_hash')
-    def test_is_pdf_protected_true(self, mock_extract, processor):
+    def test_is_pdf_protected_true(self, mock_extract, processor, pdf_path):
         """Test PDF protection check - protected."""
         mock_extract.return_value = "test.pdf:$pdf$4*4*128*-1024*1*16*..."
         
-        with tempfile.NamedTemporaryFile(suffix='.pdf') as temp_pdf:
-            result = processor.is_pdf_protected(temp_pdf.name)
-            assert result
+        assert processor.is_pdf_protected(pdf_path)
     
     @patch.object(PDFProcessor, 'extract_hash')
-    def test_is_pdf_protected_false(self, mock_extract, processor):
+    def test_is_pdf_protected_false(self, mock_extract, processor, pdf_path):
         """Test PDF protection check - not protected."""
         mock_extract.side_effect = RuntimeError("No hash")
         
-        with tempfile.NamedTemporaryFile(suffix='.pdf') as temp_pdf:
-            result = processor.is_pdf_protected(temp_pdf.name)
-            assert not result
+        assert not processor.is_pdf_protected(pdf_path)
     
     @patch.object(PDFProcessor, 'extract_hash')
-    @patch.object(PDFProcessor, 'is_pdf_protected')
-    def test_get_pdf_info(self, mock_protected, mock_extract, processor, sample_pdf_content):
+    def test_get_pdf_info(self, mock_extract, processor, pdf_path):
         """Test getting PDF information."""
-        mock_protected.return_value = True
         mock_extract.return_value = "test.pdf:$pdf$4*4*128*-1024*1*16*..."
         
-        # Create a temporary PDF file with actual content
-        with tempfile.NamedTemporaryFile(suffix='.pdf', delete=False) as temp_pdf:
-            temp_pdf.write(sample_pdf_content)
-            temp_pdf_path = temp_pdf.name
-            
-        try:
-            info = processor.get_pdf_info(temp_pdf_path)
-            
-            assert info['path'] == temp_pdf_path
-            assert info['exists']
-            assert info['protected']
-            assert info['hash'] == "test.pdf:$pdf$4*4*128*-1024*1*16*..."
-            assert info['size'] > 0
-        finally:
-            if os.path.exists(temp_pdf_path):
-                os.unlink(temp_pdf_path)
+        info = processor.get_pdf_info(pdf_path)
+        
+        assert info['path'] == pdf_path
+        assert info['exists']
+        assert info['protected']
+        assert info['hash'] == "test.pdf:$pdf$4*4*128*-1024*1*16*..."
+        assert info['size'] > 0
+        mock_extract.assert_called_once()  # pdf2john runs once per PDF
+    
+    @patch.object(PDFProcessor, 'extract_hash')
+    def test_get_pdf_info_not_protected(self, mock_extract, processor, pdf_path):
+        """Test an unprotected PDF reports no hash."""
+        mock_extract.return_value = "test.pdf not encrypted!"
+        
+        info = processor.get_pdf_info(pdf_path)
+        
+        assert not info['protected']
+        assert info['hash'] is None
+        mock_extract.assert_called_once()
 
 
 class TestPDFHashManager:
     """Test the PDFHashManager class."""
     
-    @pytest.fixture
-    def temp_dir(self):
-        """Create temporary directory."""
-        temp_dir = tempfile.mkdtemp()
-        yield temp_dir
-        import shutil
-        shutil.rmtree(temp_dir, ignore_errors=True)
+    @pytest.fixture(scope="module")
+    def temp_dir(self, tmp_path_factory):
+        """Temporary directory for hash files, shared by the module."""
+        return str(tmp_path_factory.mktemp("hashes"))
     
-    @pytest.fixture
+    @pytest.fixture(scope="module")
     def manager(self, temp_dir):
-        """Create PDFHashManager with mocked pdf2john path."""
+        """Create one PDFHashManager with mocked pdf2john path for the module."""
         with patch.object(PDFProcessor, '_find_pdf2john') as mock_find:
             mock_find.return_value = '/opt/homebrew/share/john/pdf2john.pl'
             return PDFHashManager(temp_dir)
     
+    @pytest.fixture(autouse=True)
+    def reset_manager(self, manager):
+        """Clear the shared manager's hash files after each test."""
+        yield
+        manager.cleanup()
+    
     @patch.object(PDFProcessor, 'save_hash_to_file')
-    def test_add_pdf(self, mock_save, manager):
+    def test_add_pdf(self, mock_save, manager, pdf_path):
         """Test adding PDF to batch."""
         mock_save.return_value = "test.pdf:$pdf$4*4*128*-1024*1*16*..."
         
-        with tempfile.NamedTemporaryFile(suffix='.pdf') as temp_pdf:
-            hash_file = manager.add_pdf(temp_pdf.name, "test")
-            
-            assert "test" in manager.hash_files
-            assert manager.hash_files["test"]["pdf_path"] == temp_pdf.name
-            assert hash_file.endswith("test.hash")
+        hash_file = manager.add_pdf(pdf_path, "test")
+        
+        assert "test" in manager.hash_files
+        assert manager.hash_files["test"]["pdf_path"] == pdf_path
+        assert hash_file.endswith("test.hash")
     
     @patch.object(PDFProcessor, 'save_hash_to_file')
     def test_get_combined_hash_file(self, mock_save, manager):
         """Test creating combined hash file."""
         mock_save.return_value = "test.pdf:$pdf$4*4*128*-1024*1*16*..."
         
-        with tempfile.NamedTemporaryFile(suffix='.pdf') as temp_pdf1, \
-             tempfile.NamedTemporaryFile(suffix='.pdf') as temp_pdf2:
-            
-            manager.add_pdf(temp_pdf1.name, "test1")
-            manager.add_pdf(temp_pdf2.name, "test2")
-            
-            combined_file = manager.get_combined_hash_file()
-            
-            assert os.path.exists(combined_file)
-            
-            with open(combined_file, 'r') as f:
-                lines = f.readlines()
-            
-            assert len(lines) == 2
+        manager.add_pdf("test1.pdf", "test1")
+        manager.add_pdf("test2.pdf", "test2")
+        
+        combined_file = manager.get_combined_hash_file()
+        
+        assert os.path.exists(combined_file)
+        
+        with open(combined_file, 'r') as f:
+            lines = f.readlines()
+        
+        assert lines == [mock_save.return_value + "\n"] * 2
     
     def test_context_manager(self, temp_dir):
         """Test context manager functionality."""
@@ -0,0 +1,81 @@
+#!/usr/bin/env python3
+"""
+Tests for the shared tool lookup helpers.
+"""
+
+from unittest.mock import MagicMock, patch
+import pytest
+
+from core.tool_locator import cache_found, find_executable
+
+
+class TestCacheFound:
+    """Test the cache_found locator decorator."""
+    
+    def test_hit_cached(self):
+        """Test a found path is returned without locating again."""
+        locate = MagicMock(return_value='/usr/bin/tool')
+        cached = cache_found(locate)
+        
+        assert cached() == '/usr/bin/tool'
+        assert cached() == '/usr/bin/tool'
+        locate.assert_called_once()
+    
+    def test_miss_not_cached(self):
+        """Test a miss is retried and a later hit is found."""
+        locate = MagicMock(side_effect=[None, '/usr/bin/tool'])
+        cached = cache_found(locate)
+        
+        assert cached() is None
+        assert cached() == '/usr/bin/tool'
+        assert locate.call_count == 2
+    
+    def test_cache_clear(self):
+        """Test cache_clear forces the next call to locate again."""
+        locate = MagicMock(side_effect=['/usr/bin/tool', '/opt/tool'])
+        cached = cache_found(locate)
+        
+        assert cached() == '/usr/bin/tool'
+        cached.cache_clear()
+        assert cached() == '/opt/tool'
+        assert locate.call_count == 2
+
+
+class TestFindExecutable:
+    """Test the find_executable PATH and fallback probe."""
+    
+    def test_path_hit_skips_fallbacks(self):
+        """Test an executable on PATH is returned without checking fallbacks."""
+        with patch('shutil.which', return_value='/usr/local/bin/tool') as mock_which, \
+             patch('os.path.exists') as mock_exists:
+            
+            assert find_executable('tool', ['/usr/bin/tool']) == '/usr/local/bin/tool'
+            mock_which.assert_called_once_with('tool')
+            mock_exists.assert_not_called()
+    
+    def test_fallback_order(self):
+        """Test fallback locations are checked in order and the first match wins."""
+        checked = []
+    
+        def exists(path):
+            checked.append(path)
+            return path != '/first/tool'
+        
+        with patch('shutil.which', return_value=None), \
+             patch('os.path.exists', side_effect=exists):
+            
+            path = find_executable('tool', ['/first/tool', '/second/tool', '/third/tool'])
+        
+        assert path == '/second/tool'
+        assert checked == ['/first/tool', '/second/tool']
+    
+    def test_not_found(self):
+        """Test None is returned when the executable is nowhere."""
+        with patch('shutil.which', return_value=None), \
+             patch('os.path.exists', return_value=False):
+            
+            assert find_executable('tool', ['/usr/bin/tool']) is None
+
+
+if __name__ == '__main__':
+    pytest.main([__file__])
@@ -3,15 +3,76 @@
 Tests for wordlist generator CLI tools.
 """
 
-import tempfile
-import os
+import io
 import sys
 import subprocess
+from contextlib import redirect_stdout, redirect_stderr
 from pathlib import Path
+from unittest.mock import patch
 import pytest
 
-# Add src to path
-sys.path.insert(0, os.path.join(os.path.dirname(__file__), '..', 'src'))
+import utils.wordlist_gen as wordlist_gen
+import utils.comprehensive_wordlist as comprehensive_wordlist
+
+
+def _first_last_count(path):
+    """
+    Summarize a wordlist in one streaming pass, without loading every line.
+    
+    Args:
+        path: Wordlist file to read
+        
+    Returns:
+        Tuple of (first line, last line, line count) as bytes lines
+    """
+    count = 0
+    first = last = None
+    with open(path, 'rb') as f:
+        for line in f:
+            count += 1
+            first = first or line
+            last = line
+    return first, last, count
+
+
+def _run_cli(module, argv):
+    """
+    Run a CLI module's main() in-process instead of spawning an interpreter.
+    
+    Stdin is empty, so an unexpected interactive prompt fails instead of blocking.
+    
+    Args:
+        module: CLI module with a main() function
+        argv: Command-line arguments (without the program name)
+        
+    Returns:
+        CompletedProcess with the exit code and captured stdout/stderr
+    """
+    stdout, stderr = io.StringIO(), io.StringIO()
+    
+    with patch.object(sys, 'argv', [module.__file__] + argv), \
+         patch.object(sys, 'stdin', io.StringIO()), \
+         redirect_stdout(stdout), redirect_stderr(stderr):
+        try:
+            returncode = module.main()
+        except SystemExit as e:
+            returncode = e.code
+    
+    return subprocess.CompletedProcess(argv, returncode, stdout.getvalue(), stderr.getvalue())
+
+
+@pytest.fixture(scope='session')
+def cli_output():
+    """Run read-only CLI invocations (help, estimates) once per session, keyed by argv."""
+    results = {}
+    
+    def run(module, argv):
+        key = (module.__name__, tuple(argv))
+        if key not in results:
+            results[key] = _run_cli(module, argv)
+        return results[key]
+    
+    return run
 
 
 class TestWordlistGeneratorCLI:
@@ -22,118 +83,123 @@ class TestWordlistGeneratorCLI:
         """Path to wordlist generator script."""
         return Path(__file__).parent.parent / 'src' / 'utils' / 'wordlist_gen.py'
     
-    def test_help_option(self, wordlist_gen_script):
+    def test_help_option(self, cli_output):
         """Test --help option."""
-        result = subprocess.run([
-            sys.executable, str(wordlist_gen_script), '--help'
-        ], capture_output=True, text=True)
+        result = cli_output(wordlist_gen, ['--help'])
         
         assert result.returncode == 0
         assert 'Generate wordlists for date-based passwords' in result.stdout
         assert '--start' in result.stdout
         assert '--end' in result.stdout
     
-    @pytest.mark.parametrize("year,expected_count", [
-        (2023, "365"),  # Not leap year
-        (2024, "366"),  # Leap year
-    ])
-    def test_estimate_only(self, wordlist_gen_script, year, expected_count):
-        """Test --estimate-only option."""
+    def test_script_subprocess_smoke(self, wordlist_gen_script):
+        """Test the script runs as a standalone program."""
         result = subprocess.run([
-            sys.executable, str(wordlist_gen_script),
-            '--start', str(year),
-            '--end', str(year),
-            '--estimate-only'
+            sys.executable, str(wordlist_gen_script), '--help'
         ], capture_output=True, text=True)
         
         assert result.returncode == 0
-        assert expected_count in result.stdout
+        assert 'Generate wordlists for date-based passwords' in result.stdout
+    
+    def test_estimate_only(self, cli_output):
+        """Test --estimate-only option with a per-year breakdown."""
+        result = cli_output(wordlist_gen, [
+            '--start', '2023',
+            '--end', '2024',
+            '--estimate-only',
+            '--breakdown'
+        ])
+        
+        assert result.returncode == 0
+        assert 'Total passwords: 731' in result.stdout
+        assert '2023: 365' in result.stdout  # Not leap year
+        assert '2024: 366' in result.stdout  # Leap year
         assert 'Estimate only' in result.stdout
     
-    def test_invalid_year_range(self, wordlist_gen_script):
+    def test_invalid_year_range(self, cli_output):
         """Test invalid year range."""
-        result = subprocess.run([
-            sys.executable, str(wordlist_gen_script),
+        result = cli_output(wordlist_gen, [
             '--start', '2025',
             '--end', '2020',
             '--estimate-only'
-        ], capture_output=True, text=True)
+        ])
         
         assert result.returncode == 1
         assert 'Start year must be less than or equal to end year' in result.stderr
     
     @pytest.mark.slow
-    def test_generate_small_wordlist(self, wordlist_gen_script, temp_file):
+    def test_generate_small_wordlist(self, tmp_path, wordlist_2023_ddmmyyyy):
         """Test generating a small wordlist."""
-        result = subprocess.run([
-            sys.executable, str(wordlist_gen_script),
+        output_path = tmp_path / 'dates.txt'
+        result = _run_cli(wordlist_gen, [
             '--start', '2023',
             '--end', '2023',
-            '--output', temp_file
-        ], capture_output=True, text=True, input='y\n', timeout=60)
+            '--output', str(output_path)
+        ])
         
         assert result.returncode == 0
-        assert os.path.exists(temp_file)
+        assert output_path.exists()
         
-        with open(temp_file, 'r') as f:
-            lines = f.readlines()
+        # The session wordlist is already checked for 365 lines, 01012023..31122023
+        assert output_path.read_bytes() == wordlist_2023_ddmmyyyy.read_bytes()
+    
+    def test_yes_overwrites_existing_output(self, temp_file, wordlist_2023_ddmmyyyy):
+        """Test --yes overwrites an existing output file without prompting."""
+        result = _run_cli(wordlist_gen, [
+            '--start', '2023',
+            '--end', '2023',
+            '--output', temp_file,
+            '--yes'
+        ])
         
-        assert len(lines) == 365  # 2023 is not a leap year
-        assert lines[0].strip() == '01012023'
-        assert lines[-1].strip() == '31122023'
+        assert result.returncode == 0
+        assert 'Overwrite?' not in result.stdout
+        assert Path(temp_file).read_bytes() == wordlist_2023_ddmmyyyy.read_bytes()
     
-    @pytest.mark.parametrize("date_format,expected_first,expected_length", [
-        ("DDMMYY", "010123", 6),
-        ("YYYYMMDD", "20230101", 8),
-        ("DDMMYYYY", "01012023", 8),
+    @pytest.mark.parametrize("date_format,expected_first,expected_last", [
+        ("DDMMYY", b"010123\n", b"311223\n"),
+        ("YYYYMMDD", b"20230101\n", b"20231231\n"),
+        ("DDMMYYYY", b"01012023\n", b"31122023\n"),
     ])
     @pytest.mark.slow
-    def test_date_formats(self, wordlist_gen_script, temp_file, date_format, expected_first, expected_length):
+    def test_date_formats(self, tmp_path, date_format, expected_first, expected_last):
         """Test different date formats."""
-        result = subprocess.run([
-            sys.executable, str(wordlist_gen_script),
+        output_path = tmp_path / 'dates.txt'
+        result = _run_cli(wordlist_gen, [
             '--start', '2023',
             '--end', '2023',
             '--format', date_format,
-            '--output', temp_file
-        ], capture_output=True, text=True, input='y\n', timeout=60)
+            '--output', str(output_path)
+        ])
         
         assert result.returncode == 0
-        assert os.path.exists(temp_file)
+        assert output_path.exists()
         
-        with open(temp_file, 'r') as f:
-            first_line = f.readline().strip()
+        first, last, count = _first_last_count(output_path)
         
-        assert len(first_line) == expected_length
-        assert first_line == expected_first
+        assert count == 365  # 2023 is not a leap year
+        assert first == expected_first
+        assert last == expected_last
 
 
 class TestComprehensiveWordlistCLI:
     """Test the comprehensive wordlist generator CLI tool."""
     
-    @pytest.fixture
-    def comprehensive_gen_script(self):
-        """Path to comprehensive wordlist generator script."""
-        return Path(__file__).parent.parent / 'src' / 'utils' / 'comprehensive_wordlist.py'
-    
-    def test_help_option(self, comprehensive_gen_script):
+    def test_help_option(self, cli_output):
         """Test --help option."""
-        result = subprocess.run([
-            sys.executable, str(comprehensive_gen_script), '--help'
-        ], capture_output=True, text=True)
+        result = cli_output(comprehensive_wordlist, ['--help'])
         
         assert result.returncode == 0
         assert 'Generate comprehensive PDF password wordlist' in result.stdout
         assert '--years-back' in result.stdout
         assert '--estimate-only' in result.stdout
     
-    def test_estimate_only(self, comprehensive_gen_script):
+    def test_estimate_only(self, cli_output):
         """Test --estimate-only option."""
-        result = subprocess.run([
-            sys.executable, str(comprehensive_gen_script),
+        result = cli_output(comprehensive_wordlist, [
             '--years-back', '1',  # Small range for testing
             '--estimate-only'
-        ], capture_output=True, text=True)
+        ])
         
         assert result.returncode == 0
         assert 'Gregorian dates:' in result.stdout
@@ -143,13 +209,12 @@ class TestComprehensiveWordlistCLI:
         assert 'Estimate complete' in result.stdout
     
     @pytest.mark.parametrize("years_back", [1, 5, 10])
-    def test_estimate_different_years_back(self, comprehensive_gen_script, years_back):
+    def test_estimate_different_years_back(self, cli_output, years_back):
         """Test estimation with different years back."""
-        result = subprocess.run([
-            sys.executable, str(comprehensive_gen_script),
+        result = cli_output(comprehensive_wordlist, [
             '--years-back', str(years_back),
             '--estimate-only'
-        ], capture_output=True, text=True)
+        ])
         
         assert result.returncode == 0
         assert 'Total passwords:' in result.stdout
@@ -215,4 +280,19 @@ class TestWordlistGeneratorIntegration:
         
         # Total should be sum of all parts
         expected_total = stats['gregorian_dates'] + stats['buddhist_dates'] + stats['numbers']
-        assert stats['total_passwords'] == expected_total
\ No newline at end of file
+        assert stats['total_passwords'] == expected_total
+    
+    def test_append_wordlist(self, temp_directory):
+        """Test appending a wordlist part counts and copies every line."""
+        from utils.comprehensive_wordlist import append_wordlist
+        
+        part_path = Path(temp_directory) / 'part.txt'
+        part_path.write_bytes(b'01012023\n02012023\n03012023\n')
+        output_path = Path(temp_directory) / 'combined.txt'
+        
+        with open(output_path, 'wb') as output_file:
+            output_file.write(b'00000000\n')
+            lines = append_wordlist(output_file, part_path)
+        
+        assert lines == 3
+        assert output_path.read_bytes() == b'00000000\n01012023\n02012023\n03012023\n'